@@ -7,25 +7,58 @@ Resume Parser (ML/NLP based, local only)
 - Outputs structured JSON
 """
 
+import os
 import re
 import json
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from bisect import bisect_right
+from itertools import repeat
 from pathlib import Path
 from dataclasses import dataclass, asdict
-from typing import List, Optional
+from typing import Callable, List, Optional, Tuple
 
-import pdfplumber
-import docx
-import spacy
+# Optional: Aho-Corasick automaton for single-pass skill matching
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional: Hyperscan (Linux/x86 only) to match every keyword set in one SIMD pass
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
 
 # -----------------------------
 # Load spaCy NLP model
 # -----------------------------
-# Load the spaCy model, handling potential errors if not installed
-try:
-    nlp = spacy.load("en_core_web_sm")
-except OSError:
-    print("Please install spaCy English model: python -m spacy download en_core_web_sm")
-    nlp = None
+# Only the NER entities are used, so the other components are never loaded.
+# The stock v3 "ner" embeds its own Tok2Vec; the shared "tok2vec" only feeds
+# tagger/parser, so it is excluded too unless the model's ner listens to it.
+SPACY_MODEL = "en_core_web_sm"
+SPACY_EXCLUDE = ["tok2vec", "tagger", "parser", "attribute_ruler", "lemmatizer", "senter"]
+
+@functools.lru_cache(maxsize=1)
+def _get_nlp():
+    # Load the spaCy model once, handling potential errors if not installed
+    try:
+        import spacy
+    except ImportError:
+        print("spaCy not installed. Please install it using: !pip install spacy")
+        return None
+    try:
+        nlp = spacy.load(SPACY_MODEL, exclude=SPACY_EXCLUDE)
+        if _ner_listens_to_tok2vec(nlp):
+            nlp = spacy.load(SPACY_MODEL, exclude=[c for c in SPACY_EXCLUDE if c != "tok2vec"])
+        return nlp
+    except OSError:
+        print("Please install spaCy English model: python -m spacy download en_core_web_sm")
+        return None
+
+def _ner_listens_to_tok2vec(nlp) -> bool:
+    from spacy.pipeline.tok2vec import Tok2VecListener
+    return any(isinstance(node, Tok2VecListener) for node in nlp.get_pipe("ner").model.walk())
 
 
 # -----------------------------
@@ -34,7 +67,17 @@ except OSError:
 EMAIL_RX = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
 PHONE_RX = re.compile(r"(\+?\d[\d\s().-]{7,}\d)")
 LINKEDIN_RX = re.compile(r"(https?://)?(www\.)?linkedin\.com/in/[A-Za-z0-9\-_%]+")
-YEAR_RX = re.compile(r"(19|20)\d{2}")
+YEAR_RX = re.compile(r"\b(?:19|20)\d{2}\b")
+DEGREE_RX = re.compile(r"bachelor|master|phd|mba|b\.sc|m\.sc|b\.tech|m\.tech", re.IGNORECASE)
+# Line classifiers, matched against lowercased text (much faster than re.IGNORECASE)
+EDU_KEYWORDS = ("university", "college", "institute", "school", "bachelor", "master", "phd", "mba")
+EXP_KEYWORDS = ("intern", "engineer", "developer", "manager", "consultant", "analyst", "lead")
+EDU_RX = re.compile("|".join(map(re.escape, EDU_KEYWORDS)))
+EXP_RX = re.compile("|".join(map(re.escape, EXP_KEYWORDS)))
+NEWLINE_RX = re.compile(r"\n")
+
+# Contact details live in the resume header, so the contact regexes only scan this many chars
+CONTACT_WINDOW = 4000
 
 COMMON_SKILLS = {
     "python","java","c++","c#","javascript","typescript","react","angular","vue",
@@ -44,6 +87,74 @@ COMMON_SKILLS = {
     "tensorflow","pytorch","nlp","machine learning","deep learning","html","css"
 }
 
+# The one word-boundary rule every skill matcher follows: a hit must not touch a word char
+def _is_word_char(text: str, i: int) -> bool:
+    return 0 <= i < len(text) and (text[i].isalnum() or text[i] == "_")
+
+def _build_automaton(words):
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return automaton
+
+# Built once at import; None when pyahocorasick is not installed
+_SKILL_AC = _build_automaton(COMMON_SKILLS) if ahocorasick else None
+# Python's re tries each alternative in turn; the automata find all keywords in one pass
+_EDU_AC = _build_automaton(EDU_KEYWORDS) if ahocorasick else None
+_EXP_AC = _build_automaton(EXP_KEYWORDS) if ahocorasick else None
+# Fallback: skills shaped like one token via a set probe on the text's tokens, every
+# other skill (machine learning, node.js, .net) via one pattern; lookarounds instead
+# of \b so c++/c# match
+_WORD_RE = re.compile(r"\w+")
+_SUFFIXED_WORD_RE = re.compile(r"(?<!\w)\w+(?:\+\+|#)(?!\w)")  # c++, c#
+_SINGLE_SKILLS = {s for s in COMMON_SKILLS if _WORD_RE.fullmatch(s) or _SUFFIXED_WORD_RE.fullmatch(s)}
+_MULTI_SKILLS = sorted(COMMON_SKILLS - _SINGLE_SKILLS, key=len, reverse=True)
+# Zero-width so a hit does not consume text another skill starts in (node.js / .js)
+_MULTI_SKILL_RE = re.compile(r"(?=(?<!\w)(" + "|".join(map(re.escape, _MULTI_SKILLS)) + r")(?!\w))")
+
+# (category, keyword) for each Hyperscan pattern id
+_HS_KEYWORDS = (
+    [("edu", kw) for kw in EDU_KEYWORDS]
+    + [("exp", kw) for kw in EXP_KEYWORDS]
+    + [("skill", kw) for kw in sorted(COMMON_SKILLS)]
+)
+
+def _hs_boundary(edge: str) -> str:
+    # Zero-width "neighbour is not a word char" test for a keyword edge character
+    return r"\b" if _is_word_char(edge, 0) else r"\B"
+
+def _build_keyword_database():
+    """Compile education, experience and skill keywords into one Hyperscan database.
+
+    Skills are guarded with ASCII \\b/\\B assertions derived from _is_word_char
+    (\\B where the keyword edge is itself a non-word char, as in c++); hits next to
+    non-ASCII text are re-checked in _hs_scan. Compiling Unicode classes (UCP)
+    instead would cost seconds at import.
+    """
+    expressions = []
+    for category, keyword in _HS_KEYWORDS:
+        pattern = re.escape(keyword)
+        if category == "skill":
+            pattern = _hs_boundary(keyword[0]) + pattern + _hs_boundary(keyword[-1])
+        expressions.append(pattern.encode())
+    db = hyperscan.Database()
+    try:
+        db.compile(
+            expressions=expressions,
+            ids=list(range(len(expressions))),
+            elements=len(expressions),
+            flags=[0] * len(expressions),
+        )
+    except hyperscan.error:
+        # e.g. a platform limit: use the other matchers
+        return None
+    return db
+
+# None when hyperscan is unavailable; _scan then uses the automata/regex matchers
+_HS_DB = _build_keyword_database() if hyperscan else None
+NEWLINE_BYTES_RX = re.compile(rb"\n")
+
 # -----------------------------
 # Data classes
 # -----------------------------
@@ -78,17 +189,71 @@ class Resume:
 # -----------------------------
 # Text Extraction
 # -----------------------------
-def extract_text_from_pdf(path: str) -> str:
+def _read_pdf(path: str) -> str:
+    try:
+        import pypdfium2 as pdfium
+    except ImportError:
+        raise ImportError("pypdfium2 not installed. Please install it using: !pip install pypdfium2")
+    text_parts = []
+    pdf = pdfium.PdfDocument(path)
+    try:
+        for page in pdf:
+            textpage = page.get_textpage()
+            # PDFium ends lines with \r\n; match pdfplumber's \n
+            txt = textpage.get_text_range().replace("\r\n", "\n")
+            # Release pages eagerly to bound peak memory on long documents
+            textpage.close()
+            page.close()
+            if txt:
+                text_parts.append(txt)
+    finally:
+        pdf.close()
+    return "\n".join(text_parts).strip()
+
+
+def _read_pdf_pdfplumber(path: str) -> str:
+    try:
+        import pdfplumber
+    except ImportError:
+        raise ImportError("pdfplumber not installed. Please install it using: !pip install pdfplumber")
+    text_parts = []
+    with pdfplumber.open(path) as pdf:
+        for page in pdf.pages:
+            txt = page.extract_text()
+            if txt:
+                text_parts.append(txt)
+    return "\n".join(text_parts).strip()
+
+
+def _read_docx(path: str) -> str:
     try:
-        text_parts = []
-        with pdfplumber.open(path) as pdf:
-            for page in pdf.pages:
-                txt = page.extract_text()
-                if txt:
-                    text_parts.append(txt)
-        return "\n".join(text_parts).strip()
+        import docx
     except ImportError:
-        print("pdfplumber not installed. Please install it using: !pip install pdfplumber")
+        raise ImportError("python-docx not installed. Please install it using: !pip install python-docx")
+    doc = docx.Document(path)
+    return "\n".join([p.text for p in doc.paragraphs if p.text.strip()])
+
+
+def _read_text(path: str) -> str:
+    """Dispatch on the file extension; raises where extract_text prints and returns ""."""
+    ext = Path(path).suffix.lower()
+    if ext == ".pdf":
+        return _read_pdf(path)
+    elif ext == ".docx":
+        return _read_docx(path)
+    elif ext == ".txt":
+        return Path(path).read_text(encoding="utf-8", errors="ignore")
+    else:
+        raise ValueError(f"Unsupported file type: {ext}")
+
+
+def extract_text_from_pdf(path: str, use_pdfplumber: bool = False) -> str:
+    # pypdfium2 reads raw page text without building pdfplumber's char/layout
+    # objects; pdfplumber stays available for callers that need its layout handling
+    try:
+        return _read_pdf_pdfplumber(path) if use_pdfplumber else _read_pdf(path)
+    except ImportError as e:
+        print(e)
         return ""
     except Exception as e:
         print(f"Error extracting text from PDF: {e}")
@@ -97,10 +262,9 @@ def extract_text_from_pdf(path: str) -> str:
 
 def extract_text_from_docx(path: str) -> str:
     try:
-        doc = docx.Document(path)
-        return "\n".join([p.text for p in doc.paragraphs if p.text.strip()])
-    except ImportError:
-        print("python-docx not installed. Please install it using: !pip install python-docx")
+        return _read_docx(path)
+    except ImportError as e:
+        print(e)
         return ""
     except Exception as e:
         print(f"Error extracting text from DOCX: {e}")
@@ -108,30 +272,24 @@ def extract_text_from_docx(path: str) -> str:
 
 
 def extract_text(path: str) -> str:
-    ext = Path(path).suffix.lower()
-    if ext == ".pdf":
-        return extract_text_from_pdf(path)
-    elif ext == ".docx":
-        return extract_text_from_docx(path)
-    elif ext == ".txt":
-        try:
-            return Path(path).read_text(encoding="utf-8", errors="ignore")
-        except Exception as e:
-            print(f"Error reading text file: {e}")
-            return ""
-    else:
-        print(f"Unsupported file type: {ext}")
+    try:
+        return _read_text(path)
+    except ImportError as e:
+        print(e)
+        return ""
+    except Exception as e:
+        print(f"Error extracting text from {path}: {e}")
         return ""
 
 # -----------------------------
 # Extraction Functions
 # -----------------------------
-def extract_contact(text: str) -> Contact:
-    email_match = EMAIL_RX.search(text)
-    phone_match = PHONE_RX.search(text)
-    linkedin_match = LINKEDIN_RX.search(text)
+def _first(rx, text: str) -> Optional[str]:
+    match = rx.search(text)
+    return match.group(0) if match else None
 
-    doc = nlp(text[:1000])  # only first part for speed
+def _contact_from_doc(doc, text: str) -> Contact:
+    head = text[:CONTACT_WINDOW]
     name = None
     location = None
     for ent in doc.ents:
@@ -139,57 +297,156 @@ def extract_contact(text: str) -> Contact:
             name = ent.text
         if not location and ent.label_ in ("GPE","LOC"):
             location = ent.text
+        if name and location:
+            break
 
     return Contact(
         name=name,
-        email=email_match.group(0) if email_match else None,
-        phone=phone_match.group(0) if phone_match else None,
-        linkedin=linkedin_match.group(0) if linkedin_match else None,
+        # Fall back to the whole document only for the email, the one field worth the scan
+        email=_first(EMAIL_RX, head) or _first(EMAIL_RX, text),
+        phone=_first(PHONE_RX, head),
+        linkedin=_first(LINKEDIN_RX, head),
         location=location
     )
 
+def _ner(text: str):
+    # Call the loaded components (just ner for the stock model) directly,
+    # skipping Language.__call__ bookkeeping
+    nlp = _get_nlp()
+    doc = nlp.make_doc(text)
+    for name in nlp.pipe_names:
+        doc = nlp.get_pipe(name)(doc)
+    return doc
+
+def extract_contact(text: str) -> Contact:
+    doc = _ner(text[:1000])  # only first part for speed
+    return _contact_from_doc(doc, text)
+
+def _make_education(line: str) -> Education:
+    found_years = YEAR_RX.findall(line)
+    years = " - ".join(found_years) if found_years else None
+    degree_match = DEGREE_RX.search(line)
+    degree = degree_match.group(0).upper() if degree_match else None
+    return Education(degree=degree, institution=line.strip(), years=years)
+
+def _make_experience(line: str) -> Experience:
+    found_years = YEAR_RX.findall(line)
+    years = " - ".join(found_years) if found_years else None
+    return Experience(title=line.strip(), company=None, years=years, description=line.strip())
+
+def _add_skills(text_lower: str, found: set) -> None:
+    if _SKILL_AC is not None:
+        # One linear scan over the text; keep hits not glued to other word chars
+        for end, skill in _SKILL_AC.iter(text_lower):
+            start = end - len(skill) + 1
+            if not _is_word_char(text_lower, start - 1) and not _is_word_char(text_lower, end + 1):
+                found.add(skill)
+    else:
+        found.update(_SINGLE_SKILLS.intersection(_WORD_RE.findall(text_lower)))
+        found.update(_SINGLE_SKILLS.intersection(_SUFFIXED_WORD_RE.findall(text_lower)))
+        found.update(_MULTI_SKILL_RE.findall(text_lower))
+
+def _join_lines(lines: List[str]) -> Tuple[str, List[int]]:
+    # One lowercased buffer for the regex engine, plus the offset where each line
+    # starts in it (taken from the buffer itself, as lower() can change lengths)
+    low = "\n".join(lines).lower()
+    return low, [0] + [m.end() for m in NEWLINE_RX.finditer(low)]
+
+def _matching_lines(rx, automaton, buf: str, starts: List[int]) -> List[int]:
+    """Indices of the lines of buf containing a keyword, found by scanning buf in C.
+
+    Uses the Aho-Corasick automaton when available, the equivalent regex otherwise.
+    """
+    hits = []
+    if automaton is not None:
+        for end, _ in automaton.iter(buf):
+            i = bisect_right(starts, end) - 1
+            if not hits or hits[-1] != i:
+                hits.append(i)
+        return hits
+    pos = 0
+    while True:
+        match = rx.search(buf, pos)
+        if not match:
+            return hits
+        i = bisect_right(starts, match.start()) - 1
+        hits.append(i)
+        # Skip the rest of a matched line; one hit per line is enough
+        if i + 1 >= len(starts):
+            return hits
+        pos = starts[i + 1]
+
 def extract_education(text: str) -> List[Education]:
     lines = text.splitlines()
-    education = []
-    for line in lines:
-        if any(word in line.lower() for word in ["university","college","institute","school","bachelor","master","phd","mba"]):
-            years = " - ".join(YEAR_RX.findall(line)) if YEAR_RX.findall(line) else None
-            degree = None
-            for keyword in ["bachelor","master","phd","mba","b.sc","m.sc","b.tech","m.tech"]:
-                if keyword in line.lower():
-                    degree = keyword.upper()
-                    break
-            education.append(Education(degree=degree, institution=line.strip(), years=years))
-    return education
+    return [_make_education(lines[i]) for i in _matching_lines(EDU_RX, _EDU_AC, *_join_lines(lines))]
 
 def extract_experience(text: str) -> List[Experience]:
     lines = text.splitlines()
-    experience = []
-    for line in lines:
-        if any(word in line.lower() for word in ["intern","engineer","developer","manager","consultant","analyst","lead"]):
-            years = " - ".join(YEAR_RX.findall(line)) if YEAR_RX.findall(line) else None
-            experience.append(Experience(title=line.strip(), company=None, years=years, description=line.strip()))
-    return experience
+    return [_make_experience(lines[i]) for i in _matching_lines(EXP_RX, _EXP_AC, *_join_lines(lines))]
 
 def extract_skills(text: str) -> List[str]:
-    text_lower = text.lower()
     found = set()
-    for skill in COMMON_SKILLS:
-        if re.search(r"\b" + re.escape(skill.lower()) + r"\b", text_lower):
-            found.add(skill)
+    _add_skills(text.lower(), found)
     return sorted(found)
 
+def _word_char_before(data: bytes, i: int) -> bool:
+    # Step back over UTF-8 continuation bytes to the start of the previous character
+    j = i - 1
+    while j > 0 and 0x80 <= data[j] < 0xC0:
+        j -= 1
+    return j >= 0 and _is_word_char(data[j:i].decode("utf-8", "replace"), 0)
+
+def _word_char_at(data: bytes, i: int) -> bool:
+    j = i + 1
+    while j < len(data) and 0x80 <= data[j] < 0xC0:
+        j += 1
+    return i < len(data) and _is_word_char(data[i:j].decode("utf-8", "replace"), 0)
+
+def _hs_scan(low: str) -> Tuple[List[int], List[int], set]:
+    """One Hyperscan pass over the lowercased buffer: (education lines, experience lines, skills)."""
+    data = low.encode("utf-8", "replace")
+    # Byte offsets of line starts; UTF-8 never puts a newline byte inside a character
+    starts = [0] + [m.end() for m in NEWLINE_BYTES_RX.finditer(data)]
+    hits = {"edu": set(), "exp": set(), "skill": set()}
+
+    def on_match(pattern_id, start, end, flags, context):
+        category, keyword = _HS_KEYWORDS[pattern_id]
+        if category != "skill":
+            hits[category].add(bisect_right(starts, end - 1) - 1)
+            return
+        if keyword in hits["skill"]:
+            return
+        start = end - len(keyword.encode())
+        # \b/\B see any non-ASCII byte as a non-word char; recheck those neighbours
+        if start and data[start - 1] >= 0x80 and _word_char_before(data, start):
+            return
+        if end < len(data) and data[end] >= 0x80 and _word_char_at(data, end):
+            return
+        hits["skill"].add(keyword)
+
+    _HS_DB.scan(data, match_event_handler=on_match)
+    return sorted(hits["edu"]), sorted(hits["exp"]), hits["skill"]
+
+def _scan(text: str):
+    """Classify the lines in C, then build records only for the lines that matched."""
+    lines = text.splitlines()
+    low, starts = _join_lines(lines)
+    if _HS_DB is not None:
+        edu_lines, exp_lines, skills = _hs_scan(low)
+    else:
+        edu_lines = _matching_lines(EDU_RX, _EDU_AC, low, starts)
+        exp_lines = _matching_lines(EXP_RX, _EXP_AC, low, starts)
+        skills = set()
+        _add_skills(low, skills)
+    education = [_make_education(lines[i]) for i in edu_lines]
+    experience = [_make_experience(lines[i]) for i in exp_lines]
+    return education, experience, sorted(skills)
+
 # -----------------------------
 # Main parse function
 # -----------------------------
-def parse_resume(path: str) -> dict:
-    text = extract_text(path)
-    if not text:
-        return {}
-    contact = extract_contact(text)
-    education = extract_education(text)
-    experience = extract_experience(text)
-    skills = extract_skills(text)
+def _build_resume(text: str, contact: Contact) -> dict:
+    education, experience, skills = _scan(text)
 
     resume = Resume(contact=contact, education=education, experience=experience, skills=skills)
     return {
@@ -199,6 +456,96 @@ def parse_resume(path: str) -> dict:
         "skills": resume.skills
     }
 
+def parse_resume(path: str) -> dict:
+    text = extract_text(path)
+    if not text:
+        return {}
+    return _build_resume(text, extract_contact(text))
+
+def _require_nlp():
+    nlp = _get_nlp()
+    if nlp is None:
+        raise RuntimeError(
+            f"spaCy model {SPACY_MODEL!r} could not be loaded; "
+            f"install it with: python -m spacy download {SPACY_MODEL}"
+        )
+    return nlp
+
+def _parse_batch(paths: List[str], batch_size: int = 32) -> List[dict]:
+    """Parse resumes in one process, streaming their first 1000 chars through nlp.pipe.
+
+    Each file gets its own result: {} for an empty file, {"error": ...} for one
+    that could not be read or parsed.
+    """
+    nlp = _require_nlp()
+    results = [None] * len(paths)
+    texts = {}
+    for i, path in enumerate(paths):
+        try:
+            text = _read_text(path)
+        except Exception as e:
+            print(f"Error extracting text from {path}: {e}")
+            results[i] = {"error": str(e)}
+            continue
+        if text:
+            texts[i] = text
+        else:
+            results[i] = {}
+
+    pending = list(texts)
+    try:
+        docs = list(nlp.pipe((texts[i][:1000] for i in pending), batch_size=batch_size))
+    except Exception:
+        # One bad document fails the whole nlp.pipe batch; redo them singly so only it fails
+        docs = None
+    for n, i in enumerate(pending):
+        text = texts[i]
+        try:
+            doc = docs[n] if docs is not None else _ner(text[:1000])
+            results[i] = _build_resume(text, _contact_from_doc(doc, text))
+        except Exception as e:
+            print(f"Error parsing {paths[i]}: {e}")
+            results[i] = {"error": str(e)}
+    return results
+
+def _worker_init():
+    # Load the spaCy model once per worker process, not once per task; forked
+    # workers already inherit the parent's loaded pipeline through the lru_cache
+    _get_nlp()
+
+def parse_resumes(
+    paths: List[str],
+    workers: Optional[int] = None,
+    batch_size: int = 32,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> List[dict]:
+    """Parse many resumes across worker processes; results keep the order of paths.
+
+    Files are spread over the workers in chunks of at most ceil(len(paths) / workers),
+    so every worker gets a share; batch_size only caps each chunk for nlp.pipe.
+    A file that fails yields {"error": ...} instead of aborting the run, and
+    progress(done, total) is called after every finished chunk. A worker that
+    dies outright (e.g. a native crash in pdfium on a malformed PDF) is not
+    caught per file: the pool raises BrokenProcessPool and the results are lost.
+    """
+    _require_nlp()  # fail fast rather than once per file or per worker
+    workers = workers or os.cpu_count() or 1
+    chunk_size = max(1, min(batch_size, -(-len(paths) // workers)))
+    chunks = [paths[i:i + chunk_size] for i in range(0, len(paths), chunk_size)]
+
+    def collect(batches) -> List[dict]:
+        results = []
+        for batch in batches:
+            results.extend(batch)
+            if progress:
+                progress(len(results), len(paths))
+        return results
+
+    if workers == 1 or len(paths) <= 1:
+        return collect(map(_parse_batch, chunks, repeat(batch_size)))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_worker_init) as ex:
+        return collect(ex.map(_parse_batch, chunks, repeat(batch_size)))
+
 # -----------------------------
 # Main execution block for Colab
 # -----------------------------
@@ -210,15 +557,11 @@ resume_file_path = '/content/Naukri_YogeshPopatChungde[2y_10m].pdf'
 
 
 if __name__ == "__main__":
-    # This block is intended for standalone script execution.
-    # When running in Colab, the code outside this block will be executed directly.
-    # We will move the execution logic outside this block for Colab compatibility.
-    pass # Keep the __main__ block empty or remove it if preferred.
-
-# --- Move execution logic here for Colab ---
-# Check if nlp model was loaded successfully
-if nlp:
-    result = parse_resume(resume_file_path)
-    print(json.dumps(result, indent=2))
-else:
-    print("spaCy NLP model not loaded. Please address the loading issue.")
+    # Colab runs notebook cells as __main__, so this block still executes there,
+    # while worker processes started by parse_resumes can import the module safely.
+    # Check if nlp model was loaded successfully
+    if _get_nlp():
+        result = parse_resume(resume_file_path)
+        print(json.dumps(result, indent=2))
+    else:
+        print("spaCy NLP model not loaded. Please address the loading issue.")
@@ -0,0 +1,104 @@
+"""The optional keyword backends (pyahocorasick, hyperscan) must agree with plain re."""
+
+import importlib.util
+import random
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+import pytest
+
+RESUME_PY = Path(__file__).resolve().parent.parent / "resume.py"
+OPTIONAL = ("ahocorasick", "hyperscan")
+INSTALLED = {module: importlib.util.find_spec(module) is not None for module in OPTIONAL}
+
+SAMPLES = [
+    "",
+    "\n\n",
+    "Python, Java and JavaScript; SQL/MySQL. machine learning\nDeep Learning node.js C++ c# PyTorch",
+    "pythonic javas mysql2 Docker_kube aws-gcp python3 _sql",
+    "c++java#-x +java •python c++. (c#) abc++ c++x",
+    "machine\nlearning deep  learning machine learning.",
+    "Bachelor of Technology, Pune University 2012 2016\nSenior Software Engineer at Foo 2016 - 2020",
+    "İİİİ İstanbul University 2001\nİNTERN at X\nplain school\n weird Engineer leadership",
+    "MBA, Ph.D, B.Sc and M.Tech\r\nLead Developer\x0cmanager analyst",
+]
+
+WORDS = (
+    "University college Institute school Bachelor MASTER Ph.D phd MBA B.Sc m.tech İNTERN "
+    "intern Engineer developer manager Consultant analyst Lead leadership 2019 1998 2020-2021 "
+    "foo , - • _ İ é √ 日 python Python c++ C# java# +java node.js mysql sql3 machine learning deep"
+).split(" ")
+
+
+def _random_texts(n, seed=0):
+    rng = random.Random(seed)
+    for _ in range(n):
+        yield "\n".join(
+            rng.choice(["", " ", ""]).join(rng.choice(WORDS) for _ in range(rng.randint(0, 8)))
+            for _ in range(rng.randint(0, 5))
+        )
+
+
+def _load(monkeypatch, name, blocked):
+    for module in OPTIONAL:
+        monkeypatch.delitem(sys.modules, module, raising=False)
+    for module in blocked:
+        monkeypatch.setitem(sys.modules, module, None)  # makes `import module` raise ImportError
+    spec = importlib.util.spec_from_file_location(f"resume_{name}", RESUME_PY)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _outputs(resume, text):
+    education, experience, skills = resume._scan(text)
+    return {
+        "scan": ([asdict(e) for e in education], [asdict(e) for e in experience], skills),
+        "education": [asdict(e) for e in resume.extract_education(text)],
+        "experience": [asdict(e) for e in resume.extract_experience(text)],
+        "skills": resume.extract_skills(text),
+    }
+
+
+@pytest.fixture
+def reference(monkeypatch):
+    resume = _load(monkeypatch, "re", blocked=OPTIONAL)
+    assert resume._SKILL_AC is None and resume._HS_DB is None
+    return resume
+
+
+@pytest.fixture(params=["ahocorasick", "hyperscan"])
+def backend(request, monkeypatch):
+    if not INSTALLED[request.param]:
+        pytest.skip(f"{request.param} is not installed")
+    resume = _load(monkeypatch, request.param, blocked=[m for m in OPTIONAL if m != request.param])
+    if request.param == "hyperscan" and resume._HS_DB is None:
+        pytest.skip("hyperscan database could not be compiled on this platform")
+    return resume
+
+
+def test_reference_matches(reference):
+    assert reference.extract_skills(SAMPLES[2]) == [
+        "c#", "c++", "deep learning", "java", "javascript", "machine learning",
+        "mysql", "node", "python", "pytorch", "sql",
+    ]
+    education, experience, _ = reference._scan(SAMPLES[6])
+    assert [e.years for e in education] == ["2012 - 2016"]
+    assert [e.years for e in experience] == ["2016 - 2020"]
+
+
+def test_reference_finds_every_skill(reference):
+    # Each vocabulary entry, whatever its shape, must reach one of the fallback matchers
+    for skill in reference.COMMON_SKILLS:
+        assert reference.extract_skills(f"x {skill.upper()} y") == [skill]
+
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_backend_matches_reference_on_samples(reference, backend, text):
+    assert _outputs(backend, text) == _outputs(reference, text)
+
+
+def test_backend_matches_reference_on_random_text(reference, backend):
+    for text in _random_texts(3000):
+        assert _outputs(backend, text) == _outputs(reference, text), repr(text)